@@ -7,6 +7,11 @@ from typing import IO, Any, cast
 
 from fasthooks.responses import BaseHookResponse
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
 
 def read_stdin(stdin: IO[str] | None = None) -> dict[str, Any]:
     """Read and parse JSON from stdin.
@@ -21,9 +26,14 @@ def read_stdin(stdin: IO[str] | None = None) -> dict[str, Any]:
         stdin = sys.stdin
 
     try:
-        content = stdin.read()
+        # Read raw bytes when the stream has them: skips text decoding,
+        # and orjson parses UTF-8 bytes directly
+        buffer = getattr(stdin, "buffer", None)
+        content: str | bytes = buffer.read() if buffer is not None else stdin.read()
         if not content.strip():
             return {}
+        if orjson is not None:
+            return cast(dict[str, Any], orjson.loads(content))
         return cast(dict[str, Any], json.loads(content))
     except (json.JSONDecodeError, Exception):
         return {}
@@ -41,4 +51,12 @@ def write_stdout(response: BaseHookResponse, stdout: IO[str] | None = None) -> N
 
     output = response.to_json()
     if output:
-        stdout.write(output)
+        buffer = getattr(stdout, "buffer", None)
+        if buffer is not None:
+            # Write UTF-8 bytes directly: orjson output is not ASCII-escaped
+            # and the text layer's encoding may not be UTF-8
+            stdout.flush()
+            buffer.write(output.encode())
+            buffer.flush()
+        else:
+            stdout.write(output)
@@ -4,56 +4,40 @@ from __future__ import annotations
 import functools
 import inspect
 import sys
-from collections.abc import Callable, Coroutine
+from collections.abc import Callable, Coroutine, Sequence
 from pathlib import Path
-from typing import IO, Any, get_type_hints
+from typing import IO, Any
 
 import anyio
 
 from fasthooks._internal.io import read_stdin, write_stdout
 from fasthooks.blueprint import Blueprint
 from fasthooks.depends.state import NullState, State
-from fasthooks.depends.transcript import Transcript
-from fasthooks.events.base import BaseEvent
-from fasthooks.events.lifecycle import (
-    Notification,
-    PreCompact,
-    SessionEnd,
-    SessionStart,
-    Stop,
-    SubagentStop,
-    UserPromptSubmit,
-)
-from fasthooks.events.tools import (
-    Bash,
-    Edit,
-    Glob,
-    Grep,
-    Read,
-    Task,
-    ToolEvent,
-    WebFetch,
-    WebSearch,
-    Write,
-)
+from fasthooks.events.base import TOOL_HOOK_TYPES, BaseEvent
 from fasthooks.logging import EventLogger
-from fasthooks.registry import HandlerEntry, HandlerRegistry
+from fasthooks.registry import CompiledHandler, HandlerRegistry
 from fasthooks.responses import BaseHookResponse
 from fasthooks.tasks.backend import BaseBackend, InMemoryBackend
 from fasthooks.tasks.depends import BackgroundTasks, PendingResults, Tasks
 
-# Map tool names to typed event classes
-TOOL_EVENT_MAP: dict[str, type[ToolEvent]] = {
-    "Bash": Bash,
-    "Write": Write,
-    "Read": Read,
-    "Edit": Edit,
-    "Grep": Grep,
-    "Glob": Glob,
-    "Task": Task,
-    "WebSearch": WebSearch,
-    "WebFetch": WebFetch,
-}
+
+def _transcript_type() -> type | None:
+    """Return the Transcript class if it has been imported, else None.
+
+    A handler can only be annotated with Transcript after importing it,
+    so there is no need to load the transcript models up front.
+    """
+    module = sys.modules.get("fasthooks.transcript.core")
+    return getattr(module, "Transcript", None)
+
+
+def __getattr__(name: str) -> Any:
+    # TOOL_EVENT_MAP used to live here; resolve it lazily from events.parse
+    if name == "TOOL_EVENT_MAP":
+        from fasthooks.events.parse import TOOL_EVENT_MAP
+
+        return TOOL_EVENT_MAP
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class HookApp(HandlerRegistry):
@@ -122,21 +106,9 @@ class HookApp(HandlerRegistry):
         Args:
             blueprint: Blueprint to include
         """
-        # Copy pre_tool handlers
-        for tool, handlers in blueprint._pre_tool_handlers.items():
-            self._pre_tool_handlers[tool].extend(handlers)
-
-        # Copy post_tool handlers
-        for tool, handlers in blueprint._post_tool_handlers.items():
-            self._post_tool_handlers[tool].extend(handlers)
-
-        # Copy permission handlers
-        for tool, handlers in blueprint._permission_handlers.items():
-            self._permission_handlers[tool].extend(handlers)
-
-        # Copy lifecycle handlers
-        for event_type, handlers in blueprint._lifecycle_handlers.items():
-            self._lifecycle_handlers[event_type].extend(handlers)
+        for key, handlers in blueprint._routes.items():
+            for handler, guard in handlers:
+                self._add_route(key, handler, guard)
 
     # ═══════════════════════════════════════════════════════════════
     # Runtime
@@ -197,77 +169,52 @@ class HookApp(HandlerRegistry):
             Response from first blocking handler, or None
         """
         hook_type = data.get("hook_event_name", "")
-        event: BaseEvent
-        handlers: list[HandlerEntry]
-
-        # Tool events
-        if hook_type == "PreToolUse":
-            tool_name = data.get("tool_name", "")
-            # Combine tool-specific handlers with catch-all ("*") handlers
-            handlers = (
-                self._pre_tool_handlers.get(tool_name, [])
-                + self._pre_tool_handlers.get("*", [])
-            )
-            event = self._parse_tool_event(tool_name, data)
-            return await self._run_with_middleware(handlers, event)
-
-        elif hook_type == "PostToolUse":
-            tool_name = data.get("tool_name", "")
-            # Combine tool-specific handlers with catch-all ("*") handlers
-            handlers = (
-                self._post_tool_handlers.get(tool_name, [])
-                + self._post_tool_handlers.get("*", [])
-            )
-            event = self._parse_tool_event(tool_name, data)
-            return await self._run_with_middleware(handlers, event)
-
-        elif hook_type == "PermissionRequest":
-            tool_name = data.get("tool_name", "")
-            # Combine tool-specific handlers with catch-all ("*") handlers
-            handlers = (
-                self._permission_handlers.get(tool_name, [])
-                + self._permission_handlers.get("*", [])
-            )
-            event = self._parse_tool_event(tool_name, data)
-            return await self._run_with_middleware(handlers, event)
+        tool_name = data.get("tool_name", "") if hook_type in TOOL_HOOK_TYPES else ""
 
-        # Lifecycle events
-        elif hook_type in self._lifecycle_handlers:
-            handlers = self._lifecycle_handlers[hook_type]
-            event = self._parse_lifecycle_event(hook_type, data)
-            return await self._run_with_middleware(handlers, event)
+        handlers = self._resolve_handlers(hook_type, tool_name)
 
-        # No matching handlers
-        return None
+        # Nothing to run: skip event validation entirely. Tool events still
+        # go through middleware, which may respond without any handler.
+        if not handlers and (not self._middleware or hook_type not in TOOL_HOOK_TYPES):
+            return None
+
+        # Typed event models are only built once an event needs parsing
+        from fasthooks.events.parse import parse_event
+
+        # One validation through the cached HookEvent adapter picks the typed class
+        event = parse_event(data)
+        return await self._run_with_middleware(handlers, event)
 
-    def _parse_tool_event(self, tool_name: str, data: dict[str, Any]) -> ToolEvent:
-        """Parse data into typed tool event."""
-        event_class = TOOL_EVENT_MAP.get(tool_name, ToolEvent)
-        return event_class.model_validate(data)
-
-    def _parse_lifecycle_event(self, hook_type: str, data: dict[str, Any]) -> BaseEvent:
-        """Parse data into typed lifecycle event."""
-        event_classes: dict[str, type[BaseEvent]] = {
-            "Stop": Stop,
-            "SubagentStop": SubagentStop,
-            "SessionStart": SessionStart,
-            "SessionEnd": SessionEnd,
-            "PreCompact": PreCompact,
-            "UserPromptSubmit": UserPromptSubmit,
-            "Notification": Notification,
-        }
-        event_class = event_classes.get(hook_type, BaseEvent)
-        return event_class.model_validate(data)
+    def _resolve_handlers(
+        self, hook_type: str, tool_name: str
+    ) -> tuple[CompiledHandler, ...]:
+        """Get effective handlers for a route, memoized until the next registration.
+
+        Tool-specific (or lifecycle) handlers come first, then catch-all ("*")
+        tool handlers.
+        """
+        key = (hook_type, tool_name)
+        handlers = self._resolved_routes.get(key)
+        if handlers is None:
+            handlers = tuple(
+                CompiledHandler.compile(entry)
+                for entry in (
+                    *self._routes.get(key, ()),
+                    *self._routes.get((hook_type, "*"), ()),
+                )
+            )
+            self._resolved_routes[key] = handlers
+        return handlers
 
     async def _run_with_middleware(
         self,
-        handlers: list[HandlerEntry],
+        handlers: Sequence[CompiledHandler],
         event: BaseEvent,
     ) -> BaseHookResponse | None:
         """Run handlers wrapped in middleware chain.
 
         Args:
-            handlers: List of (handler, guard) tuples
+            handlers: Compiled handlers, in run order
             event: Typed event object
 
         Returns:
@@ -315,13 +262,13 @@ class HookApp(HandlerRegistry):
 
     async def _run_handlers(
         self,
-        handlers: list[HandlerEntry],
+        handlers: Sequence[CompiledHandler],
         event: BaseEvent,
     ) -> BaseHookResponse | None:
         """Run handlers in order, stopping when should_return() is True.
 
         Args:
-            handlers: List of (handler, guard) tuples
+            handlers: Compiled handlers, in run order
             event: Typed event object
 
         Returns:
@@ -330,11 +277,11 @@ class HookApp(HandlerRegistry):
         # Cache for dependencies that should be shared across handlers
         dep_cache: dict[str, Any] = {}
 
-        for handler, guard in handlers:
+        for handler, guard, name, is_async, guard_is_async, params in handlers:
             try:
                 # Check guard condition (supports async guards)
                 if guard is not None:
-                    if inspect.iscoroutinefunction(guard):
+                    if guard_is_async:
                         guard_result = await guard(event)
                     else:
                         guard_result = await anyio.to_thread.run_sync(
@@ -344,10 +291,10 @@ class HookApp(HandlerRegistry):
                         continue  # Guard failed, skip handler
 
                 # Build dependencies based on type hints
-                deps = self._resolve_dependencies(handler, event, dep_cache)
+                deps = self._resolve_dependencies(params, event, dep_cache)
 
                 # Run handler (supports async handlers)
-                if inspect.iscoroutinefunction(handler):
+                if is_async:
                     response: BaseHookResponse | None = await handler(event, **deps)
                 else:
                     response = await anyio.to_thread.run_sync(
@@ -359,21 +306,21 @@ class HookApp(HandlerRegistry):
                     return response
             except Exception as e:
                 # Log and continue (fail open)
-                print(f"[fasthooks] Handler {handler.__name__} failed: {e}", file=sys.stderr)
+                print(f"[fasthooks] Handler {name} failed: {e}", file=sys.stderr)
                 continue
 
         return None
 
     def _resolve_dependencies(
         self,
-        handler: Callable[..., Any],
+        params: Sequence[tuple[str, Any]],
         event: BaseEvent,
         cache: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
         """Resolve dependencies for a handler based on type hints.
 
         Args:
-            handler: Handler function to inspect
+            params: (param_name, type hint) pairs from the compiled handler
             event: Event object (for transcript_path, session_id)
             cache: Optional cache dict for sharing deps across handlers
 
@@ -384,22 +331,13 @@ class HookApp(HandlerRegistry):
         if cache is None:
             cache = {}
 
-        try:
-            hints = get_type_hints(handler)
-        except Exception:
-            return deps
-
-        sig = inspect.signature(handler)
-        for param_name, param in sig.parameters.items():
-            if param_name == "event":
-                continue
-
-            hint = hints.get(param_name)
-            if hint is Transcript:
+        transcript_type = _transcript_type()
+        for param_name, hint in params:
+            if transcript_type is not None and hint is transcript_type:
                 # Cache Transcript per event to avoid redundant loads
                 if "transcript" not in cache:
                     transcript_path = getattr(event, "transcript_path", None)
-                    cache["transcript"] = Transcript(transcript_path)
+                    cache["transcript"] = transcript_type(transcript_path)
                 deps[param_name] = cache["transcript"]
             elif hint is State:
                 if self.state_dir:
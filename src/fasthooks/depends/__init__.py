@@ -1,5 +1,32 @@
-"""Dependency injection components."""
+"""Dependency injection components.
+
+Transcript is imported on first attribute access (PEP 562), so hooks
+that never inject it skip building the transcript models.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
 from fasthooks.depends.state import State
-from fasthooks.depends.transcript import Transcript, TranscriptStats
+
+if TYPE_CHECKING:
+    from fasthooks.depends.transcript import Transcript, TranscriptStats
+
+_LAZY_IMPORTS = ("Transcript", "TranscriptStats")
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from fasthooks.depends import transcript
+
+    value = getattr(transcript, name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY_IMPORTS])
+
 
 __all__ = ["State", "Transcript", "TranscriptStats"]
@@ -1,31 +1,86 @@
-"""Event models for Claude Code hooks."""
-from fasthooks.events.base import BaseEvent
-from fasthooks.events.lifecycle import (
-    Notification,
-    PermissionRequest,
-    PreCompact,
-    SessionEnd,
-    SessionStart,
-    Stop,
-    SubagentStop,
-    UserPromptSubmit,
-)
-from fasthooks.events.tools import (
-    Bash,
-    Edit,
-    Glob,
-    Grep,
-    Read,
-    Task,
-    ToolEvent,
-    WebFetch,
-    WebSearch,
-    Write,
-)
+"""Event models for Claude Code hooks.
+
+Submodules are imported on first attribute access (PEP 562), so a hook
+process only builds the event models it actually touches.
+"""
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from fasthooks.events.base import BaseEvent
+    from fasthooks.events.lifecycle import (
+        Notification,
+        PermissionRequest,
+        PreCompact,
+        SessionEnd,
+        SessionStart,
+        Stop,
+        SubagentStop,
+        UserPromptSubmit,
+    )
+    from fasthooks.events.parse import HookEvent, parse_event
+    from fasthooks.events.tools import (
+        Bash,
+        Edit,
+        Glob,
+        Grep,
+        Read,
+        Task,
+        ToolEvent,
+        WebFetch,
+        WebSearch,
+        Write,
+    )
+
+# Public name -> submodule that defines it
+_LAZY_IMPORTS: dict[str, str] = {
+    # Base
+    "BaseEvent": "fasthooks.events.base",
+    "HookEvent": "fasthooks.events.parse",
+    "parse_event": "fasthooks.events.parse",
+    # Tools
+    "Bash": "fasthooks.events.tools",
+    "Edit": "fasthooks.events.tools",
+    "Glob": "fasthooks.events.tools",
+    "Grep": "fasthooks.events.tools",
+    "Read": "fasthooks.events.tools",
+    "Task": "fasthooks.events.tools",
+    "ToolEvent": "fasthooks.events.tools",
+    "WebFetch": "fasthooks.events.tools",
+    "WebSearch": "fasthooks.events.tools",
+    "Write": "fasthooks.events.tools",
+    # Lifecycle
+    "Notification": "fasthooks.events.lifecycle",
+    "PermissionRequest": "fasthooks.events.lifecycle",
+    "PreCompact": "fasthooks.events.lifecycle",
+    "SessionEnd": "fasthooks.events.lifecycle",
+    "SessionStart": "fasthooks.events.lifecycle",
+    "Stop": "fasthooks.events.lifecycle",
+    "SubagentStop": "fasthooks.events.lifecycle",
+    "UserPromptSubmit": "fasthooks.events.lifecycle",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY_IMPORTS])
+
 
 __all__ = [
     # Base
     "BaseEvent",
+    "HookEvent",
+    "parse_event",
     # Tools
     "Bash",
     "Edit",
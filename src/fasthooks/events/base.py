@@ -3,6 +3,9 @@ from __future__ import annotations
 
 from pydantic import BaseModel, ConfigDict
 
+# Hook types whose payload is a tool event (routed by tool_name)
+TOOL_HOOK_TYPES = frozenset({"PreToolUse", "PostToolUse", "PermissionRequest"})
+
 
 class BaseEvent(BaseModel):
     """Base model for all Claude Code hook events.
@@ -0,0 +1,111 @@
+"""Parse raw hook input into the matching typed event."""
+from __future__ import annotations
+
+from typing import Annotated, Any
+
+from pydantic import Discriminator, Tag, TypeAdapter
+
+from fasthooks.events.base import TOOL_HOOK_TYPES, BaseEvent
+from fasthooks.events.lifecycle import (
+    Notification,
+    PreCompact,
+    SessionEnd,
+    SessionStart,
+    Stop,
+    SubagentStop,
+    UserPromptSubmit,
+)
+from fasthooks.events.tools import (
+    Bash,
+    Edit,
+    Glob,
+    Grep,
+    Read,
+    Task,
+    ToolEvent,
+    WebFetch,
+    WebSearch,
+    Write,
+)
+
+# Map tool names to typed event classes
+TOOL_EVENT_MAP: dict[str, type[ToolEvent]] = {
+    "Bash": Bash,
+    "Write": Write,
+    "Read": Read,
+    "Edit": Edit,
+    "Grep": Grep,
+    "Glob": Glob,
+    "Task": Task,
+    "WebSearch": WebSearch,
+    "WebFetch": WebFetch,
+}
+
+# Map lifecycle hook names to typed event classes
+LIFECYCLE_EVENT_MAP: dict[str, type[BaseEvent]] = {
+    "Stop": Stop,
+    "SubagentStop": SubagentStop,
+    "SessionStart": SessionStart,
+    "SessionEnd": SessionEnd,
+    "PreCompact": PreCompact,
+    "UserPromptSubmit": UserPromptSubmit,
+    "Notification": Notification,
+}
+
+
+def _event_tag(data: Any) -> str:
+    """Pick the union member for raw hook input.
+
+    Tool hooks are tagged by tool name (falling back to ToolEvent),
+    lifecycle hooks by hook name (falling back to BaseEvent).
+    """
+    if isinstance(data, dict):
+        hook_type = data.get("hook_event_name", "")
+        tool_name = data.get("tool_name", "")
+    else:
+        hook_type = getattr(data, "hook_event_name", "")
+        tool_name = getattr(data, "tool_name", "")
+
+    if hook_type in TOOL_HOOK_TYPES:
+        return str(tool_name) if tool_name in TOOL_EVENT_MAP else "ToolEvent"
+    if hook_type in LIFECYCLE_EVENT_MAP:
+        return str(hook_type)
+    return "BaseEvent"
+
+
+# Tagged union of every typed event, dispatched inside pydantic-core
+HookEvent = Annotated[
+    Annotated[Bash, Tag("Bash")]
+    | Annotated[Write, Tag("Write")]
+    | Annotated[Read, Tag("Read")]
+    | Annotated[Edit, Tag("Edit")]
+    | Annotated[Grep, Tag("Grep")]
+    | Annotated[Glob, Tag("Glob")]
+    | Annotated[Task, Tag("Task")]
+    | Annotated[WebSearch, Tag("WebSearch")]
+    | Annotated[WebFetch, Tag("WebFetch")]
+    | Annotated[ToolEvent, Tag("ToolEvent")]
+    | Annotated[Stop, Tag("Stop")]
+    | Annotated[SubagentStop, Tag("SubagentStop")]
+    | Annotated[SessionStart, Tag("SessionStart")]
+    | Annotated[SessionEnd, Tag("SessionEnd")]
+    | Annotated[PreCompact, Tag("PreCompact")]
+    | Annotated[UserPromptSubmit, Tag("UserPromptSubmit")]
+    | Annotated[Notification, Tag("Notification")]
+    | Annotated[BaseEvent, Tag("BaseEvent")],
+    Discriminator(_event_tag),
+]
+
+_EVENT_ADAPTER: TypeAdapter[BaseEvent] = TypeAdapter(HookEvent)
+
+
+def parse_event(data: dict[str, Any]) -> BaseEvent:
+    """Parse raw hook input into its typed event.
+
+    Args:
+        data: Raw input data (as Claude Code sends it)
+
+    Returns:
+        Typed event, e.g. Bash for a PreToolUse on the Bash tool
+    """
+    return _EVENT_ADAPTER.validate_python(data)
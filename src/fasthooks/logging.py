@@ -1,47 +1,253 @@
 """Built-in JSONL logging for fasthooks."""
 from __future__ import annotations
 
+import atexit
+import functools
 import json
-from datetime import UTC, datetime
+import os
+import re
+import sys
+import threading
+import time
+import weakref
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
+# Tool input fields flattened into log entries, as (input key, entry key)
+_TOOL_FIELDS: dict[str, tuple[tuple[str, str], ...]] = {
+    "Bash": (("command", "bash_command"), ("description", "bash_description")),
+    "Write": (("file_path", "file_path"),),
+    "Edit": (("file_path", "file_path"),),
+    "Read": (("file_path", "file_path"),),
+    "Grep": (("pattern", "grep_pattern"),),
+    "Glob": (("pattern", "glob_pattern"),),
+    "Task": (("subagent_type", "subagent_type"), ("model", "subagent_model")),
+    "WebSearch": (("query", "search_query"),),
+    "WebFetch": (("url", "fetch_url"),),
+}
+
+# Lifecycle event fields copied into log entries
+_LIFECYCLE_FIELDS: dict[str, tuple[str, ...]] = {
+    "UserPromptSubmit": ("prompt",),
+    "Stop": ("stop_hook_active",),
+    "SubagentStop": ("agent_id", "stop_hook_active"),
+    "SessionStart": ("source", "transcript_path"),
+    "SessionEnd": ("reason",),
+    "PreCompact": ("trigger",),
+    "Notification": ("message", "notification_type"),
+}
+
+# Session ids used in file names; anything else (e.g. "../x") logs as "unknown"
+_is_safe_session_id = re.compile(r"[\w-]{1,128}").fullmatch
+
+
+def _dumps_line(entry: dict[str, Any]) -> bytes:
+    """Serialize a log entry as one JSONL line, with orjson when available."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE)
+        except TypeError:  # e.g. integers beyond 64 bits; let json handle it
+            pass
+    return (json.dumps(entry) + "\n").encode()
+
+
+def _flush_at_exit(flush: weakref.WeakMethod[Any]) -> None:
+    """Flush a logger at interpreter exit if it is still alive."""
+    method = flush()
+    if method is not None:
+        method()
+
+
+def _write_all(fd: int, data: bytes | bytearray) -> None:
+    """Write all of data to fd, retrying short writes."""
+    # O_APPEND keeps each write at the end of the file, even when other
+    # processes log to the same session
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+# fdatasync skips flushing unchanged metadata; not available on macOS
+_fdatasync = getattr(os, "fdatasync", os.fsync)
+
 
 class EventLogger:
     """JSONL event logger that writes to session-specific files.
 
     Logs all hook events to `{log_dir}/hooks-{session_id}.jsonl`
     and maintains a `latest.jsonl` symlink.
+
+    By default every event is written immediately. With `buffer_size` set,
+    lines are collected per session and written in one call once a
+    session's buffer reaches that many bytes, when `latest.jsonl` moves to
+    that session, on `flush()`/`close()`, or at interpreter exit.
+
+    Session files stay open between events, up to `max_open_files` with
+    the least recently used closed first.
+
+    Writes are not synced to disk by default. `fsync_every=N` syncs open
+    session files once every N events (group commit), and
+    `log(..., durable=True)` syncs before returning.
+
+    Safe to share between threads: entries are built and serialized
+    without locking, and only the file I/O is serialized.
     """
 
-    def __init__(self, log_dir: str | Path):
+    def __init__(
+        self,
+        log_dir: str | Path,
+        buffer_size: int = 0,
+        max_open_files: int = 32,
+        fsync_every: int = 0,
+    ):
         """Initialize EventLogger.
 
         Args:
             log_dir: Directory to write log files
+            buffer_size: Bytes to buffer per session before writing
+                (0 writes every event immediately)
+            max_open_files: Session files to keep open between writes
+                (0 opens and closes the file for every write)
+            fsync_every: Sync session files to disk every N events
+                (0 leaves syncing to the OS)
         """
         self.log_dir = Path(log_dir)
         self.log_dir.mkdir(parents=True, exist_ok=True)
+        # Plain string prefix for per-event paths; cheaper than Path joins
+        self._log_dir_str = os.fspath(self.log_dir) + os.sep
+        self.buffer_size = buffer_size
+        self.max_open_files = max_open_files
+        self.fsync_every = fsync_every
+        self._unsynced = 0
+        self._buffers: dict[str, bytearray] = {}
+        self._fds: OrderedDict[str, int] = OrderedDict()
+        self._ts_cache = (-1, "")  # (second, formatted), swapped as one
+        self._lock = threading.RLock()
+        # Weak, so registering for exit does not keep the logger alive
+        self._atexit = functools.partial(_flush_at_exit, weakref.WeakMethod(self.flush))
+        if buffer_size > 0:
+            atexit.register(self._atexit)
 
-    def log(self, data: dict[str, Any]) -> None:
+    def log(self, data: dict[str, Any], durable: bool = False) -> None:
         """Log an event to the appropriate session file.
 
         Args:
             data: Raw hook input data
+            durable: Write and sync to disk before returning
         """
-        session_id = data.get("session_id", "unknown")
-        ts = datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
+        session_id = data.get("session_id")
+        if not isinstance(session_id, str) or not _is_safe_session_id(session_id):
+            session_id = "unknown"
 
         # Build log entry
-        entry = self._build_entry(data, ts)
+        entry = self._build_entry(data, self._now_iso())
+
+        line = _dumps_line(entry)
+        with self._lock:
+            if self.buffer_size > 0:
+                buffer = self._buffers.setdefault(session_id, bytearray())
+                buffer += line
+                if durable or len(buffer) >= self.buffer_size:
+                    self._write(session_id, buffer, durable)
+                    buffer.clear()  # Reuse the allocation for the next batch
+            else:
+                self._write(session_id, line, durable)
+
+            if durable or self.fsync_every > 0:
+                self._unsynced += 1
+                if durable or self._unsynced >= self.fsync_every:
+                    self.sync()
 
-        # Write to session file
-        session_file = self.log_dir / f"hooks-{session_id}.jsonl"
-        with open(session_file, "a") as f:
-            f.write(json.dumps(entry) + "\n")
+            # Update latest.jsonl symlink
+            self._update_symlink(session_id)
 
-        # Update latest.jsonl symlink
-        self._update_symlink(session_id)
+    def flush(self) -> None:
+        """Write out any buffered lines."""
+        with self._lock:
+            for session_id, buffer in self._buffers.items():
+                if buffer:
+                    self._write(session_id, buffer)
+                    buffer.clear()
+
+    def sync(self) -> None:
+        """Write out buffered lines and sync open session files to disk."""
+        with self._lock:
+            self.flush()
+            for fd in self._fds.values():
+                _fdatasync(fd)
+            self._unsynced = 0
+
+    def close(self) -> None:
+        """Flush buffered lines, close session files, and stop buffering.
+
+        The logger can still be used; later events are written immediately.
+        """
+        with self._lock:
+            if self._unsynced:
+                self.sync()
+            else:
+                self.flush()
+            if self.buffer_size > 0:
+                atexit.unregister(self._atexit)
+                self.buffer_size = 0
+            while self._fds:
+                os.close(self._fds.popitem()[1])
+
+    def __del__(self) -> None:
+        if sys.is_finalizing():
+            return  # Globals may be gone; the exit hook already flushed
+        try:
+            self.flush()  # Buffered lines would otherwise die with the logger
+        except Exception:
+            pass
+        for fd in getattr(self, "_fds", {}).values():
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+    def _write(
+        self, session_id: str, data: bytes | bytearray, durable: bool = False
+    ) -> None:
+        """Append raw bytes to a session's log file."""
+        fd = self._fds.get(session_id)
+        if fd is None:
+            session_file = f"{self._log_dir_str}hooks-{session_id}.jsonl"
+            fd = os.open(session_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            if self.max_open_files <= 0:
+                # Nothing stays open for sync() to reach, so sync here
+                try:
+                    _write_all(fd, data)
+                    if durable or self.fsync_every > 0:
+                        _fdatasync(fd)
+                finally:
+                    os.close(fd)
+                return
+            if len(self._fds) >= self.max_open_files:
+                evicted = self._fds.popitem(last=False)[1]
+                if self._unsynced:
+                    _fdatasync(evicted)  # Keep the group commit promise
+                os.close(evicted)
+            self._fds[session_id] = fd
+        else:
+            self._fds.move_to_end(session_id)
+
+        _write_all(fd, data)
+
+    def _now_iso(self) -> str:
+        """Current UTC time as ISO 8601, formatted at most once per second."""
+        second = int(time.time())
+        cached_second, ts = self._ts_cache
+        if second != cached_second:
+            ts = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(second))
+            self._ts_cache = (second, ts)
+        return ts
 
     def _build_entry(self, data: dict[str, Any], ts: str) -> dict[str, Any]:
         """Build a log entry with flattened fields.
@@ -53,75 +259,68 @@ class EventLogger:
         Returns:
             Flattened log entry dict
         """
-        event = data.get("hook_event_name", "unknown")
-        tool_name = data.get("tool_name")
-        tool_input = data.get("tool_input", {})
-
-        entry: dict[str, Any] = {
-            "ts": ts,
-            "session_id": data.get("session_id"),
-            "event": event,
-            "cwd": data.get("cwd"),
-            "permission_mode": data.get("permission_mode"),
-        }
+        # Only non-None values are stored, so no filtering pass is needed
+        entry: dict[str, Any] = {"ts": ts}
+        if (session_id := data.get("session_id")) is not None:
+            entry["session_id"] = session_id
+        if (event := data.get("hook_event_name", "unknown")) is not None:
+            entry["event"] = event
+        if (cwd := data.get("cwd")) is not None:
+            entry["cwd"] = cwd
+        if (permission_mode := data.get("permission_mode")) is not None:
+            entry["permission_mode"] = permission_mode
 
         # Tool events
+        tool_name = data.get("tool_name")
         if tool_name:
             entry["tool_name"] = tool_name
-            entry["tool_input"] = tool_input
-
-            # Flatten tool-specific fields for easier querying
-            if tool_name == "Bash":
-                entry["bash_command"] = tool_input.get("command")
-                entry["bash_description"] = tool_input.get("description")
-            elif tool_name in ("Write", "Edit", "Read"):
-                entry["file_path"] = tool_input.get("file_path")
-            elif tool_name == "Grep":
-                entry["grep_pattern"] = tool_input.get("pattern")
-            elif tool_name == "Glob":
-                entry["glob_pattern"] = tool_input.get("pattern")
-            elif tool_name == "Task":
-                entry["subagent_type"] = tool_input.get("subagent_type")
-                entry["subagent_model"] = tool_input.get("model")
-            elif tool_name == "WebSearch":
-                entry["search_query"] = tool_input.get("query")
-            elif tool_name == "WebFetch":
-                entry["fetch_url"] = tool_input.get("url")
+            tool_input = data.get("tool_input", {})
+            if tool_input is not None:
+                entry["tool_input"] = tool_input
+
+                # Flatten tool-specific fields for easier querying
+                for src, dst in _TOOL_FIELDS.get(tool_name, ()):
+                    if (value := tool_input.get(src)) is not None:
+                        entry[dst] = value
 
         # Tool response (PostToolUse)
-        if data.get("tool_response"):
-            entry["tool_response"] = data["tool_response"]
+        if tool_response := data.get("tool_response"):
+            entry["tool_response"] = tool_response
             # Extract agent_id for Task tool
             if tool_name == "Task":
-                entry["agent_id"] = data["tool_response"].get("agentId")
+                if (agent_id := tool_response.get("agentId")) is not None:
+                    entry["agent_id"] = agent_id
 
         # Lifecycle event fields
-        if event == "UserPromptSubmit":
-            entry["prompt"] = data.get("prompt")
-        elif event == "Stop":
-            entry["stop_hook_active"] = data.get("stop_hook_active")
-        elif event == "SubagentStop":
-            entry["agent_id"] = data.get("agent_id")
-            entry["stop_hook_active"] = data.get("stop_hook_active")
-        elif event == "SessionStart":
-            entry["source"] = data.get("source")
-            entry["transcript_path"] = data.get("transcript_path")
-        elif event == "SessionEnd":
-            entry["reason"] = data.get("reason")
-        elif event == "PreCompact":
-            entry["trigger"] = data.get("trigger")
-        elif event == "Notification":
-            entry["message"] = data.get("message")
-            entry["notification_type"] = data.get("notification_type")
-
-        # Remove None values
-        return {k: v for k, v in entry.items() if v is not None}
+        for key in _LIFECYCLE_FIELDS.get(event, ()):
+            if (value := data.get(key)) is not None:
+                entry[key] = value
+
+        return entry
 
     def _update_symlink(self, session_id: str) -> None:
         """Update latest.jsonl symlink to current session file."""
-        latest = self.log_dir / "latest.jsonl"
+        latest = self._log_dir_str + "latest.jsonl"
+        target = f"hooks-{session_id}.jsonl"
+        # Read the link every time: other processes may log to this directory
+        try:
+            if os.readlink(latest) == target:
+                return
+        except OSError:
+            pass  # Missing or not a symlink
+
+        # Never point readers at a session whose lines are still buffered
+        buffer = self._buffers.get(session_id)
+        if buffer:
+            self._write(session_id, buffer)
+            buffer.clear()
+
+        # Swap in a new link with one rename so latest.jsonl never goes missing
+        tmp = f"{self._log_dir_str}.latest.{os.getpid()}.tmp"
         try:
-            latest.unlink(missing_ok=True)
-            latest.symlink_to(f"hooks-{session_id}.jsonl")
+            if os.path.lexists(tmp):
+                os.unlink(tmp)
+            os.symlink(target, tmp)
+            os.replace(tmp, latest)
         except OSError:
             pass  # Best effort
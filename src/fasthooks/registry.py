@@ -1,13 +1,58 @@
 """Handler registry base class for HookApp and Blueprint."""
 from __future__ import annotations
 
+import inspect
 from collections import defaultdict
 from collections.abc import Callable
-from typing import Any
+from typing import Any, NamedTuple, get_type_hints
 
 # Type alias for handler with optional guard
 HandlerEntry = tuple[Callable[..., Any], Callable[..., Any] | None]
 
+# Route key: (hook_event_name, tool_name). Tool hooks use "*" for catch-all
+# handlers; lifecycle hooks have no tool and use "".
+RouteKey = tuple[str, str]
+
+
+class CompiledHandler(NamedTuple):
+    """A handler entry with the facts dispatch needs worked out up front."""
+
+    func: Callable[..., Any]
+    guard: Callable[..., Any] | None
+    name: str
+    is_async: bool
+    guard_is_async: bool
+    # (param_name, type hint) for parameters other than event; which hints
+    # are injectable is decided by HookApp at dispatch time
+    params: tuple[tuple[str, Any], ...]
+
+    @classmethod
+    def compile(cls, entry: HandlerEntry) -> CompiledHandler:
+        """Build from a (handler, guard) entry."""
+        func, guard = entry
+        return cls(
+            func,
+            guard,
+            getattr(func, "__name__", repr(func)),
+            inspect.iscoroutinefunction(func),
+            guard is not None and inspect.iscoroutinefunction(guard),
+            _hinted_params(func),
+        )
+
+
+def _hinted_params(func: Callable[..., Any]) -> tuple[tuple[str, Any], ...]:
+    """Get (param_name, type hint) pairs for a handler's annotated parameters."""
+    try:
+        hints = get_type_hints(func)
+        parameters = inspect.signature(func).parameters
+    except Exception:
+        return ()
+    return tuple(
+        (param_name, hints[param_name])
+        for param_name in parameters
+        if param_name != "event" and param_name in hints
+    )
+
 
 class HandlerRegistry:
     """Base class for registering hook handlers.
@@ -17,10 +62,16 @@ class HandlerRegistry:
     """
 
     def __init__(self) -> None:
-        self._pre_tool_handlers: dict[str, list[HandlerEntry]] = defaultdict(list)
-        self._post_tool_handlers: dict[str, list[HandlerEntry]] = defaultdict(list)
-        self._permission_handlers: dict[str, list[HandlerEntry]] = defaultdict(list)
-        self._lifecycle_handlers: dict[str, list[HandlerEntry]] = defaultdict(list)
+        self._routes: dict[RouteKey, list[HandlerEntry]] = defaultdict(list)
+        # Effective handlers per route (specific + catch-all), filled on dispatch
+        self._resolved_routes: dict[RouteKey, tuple[CompiledHandler, ...]] = {}
+
+    def _add_route(
+        self, key: RouteKey, func: Callable[..., Any], when: Callable[..., Any] | None
+    ) -> None:
+        """Register a handler under a route and drop memoized resolutions."""
+        self._routes[key].append((func, when))
+        self._resolved_routes.clear()
 
     # ═══════════════════════════════════════════════════════════════
     # Tool Decorators
@@ -43,7 +94,7 @@ class HandlerRegistry:
         def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
             targets = tools if tools else ("*",)
             for tool in targets:
-                self._pre_tool_handlers[tool].append((func, when))
+                self._add_route(("PreToolUse", tool), func, when)
             return func
 
         return decorator
@@ -65,7 +116,7 @@ class HandlerRegistry:
         def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
             targets = tools if tools else ("*",)
             for tool in targets:
-                self._post_tool_handlers[tool].append((func, when))
+                self._add_route(("PostToolUse", tool), func, when)
             return func
 
         return decorator
@@ -80,7 +131,7 @@ class HandlerRegistry:
         """Decorator for Stop events (main agent finished)."""
 
         def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
-            self._lifecycle_handlers["Stop"].append((func, when))
+            self._add_route(("Stop", ""), func, when)
             return func
 
         return decorator
@@ -91,7 +142,7 @@ class HandlerRegistry:
         """Decorator for SubagentStop events."""
 
         def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
-            self._lifecycle_handlers["SubagentStop"].append((func, when))
+            self._add_route(("SubagentStop", ""), func, when)
             return func
 
         return decorator
@@ -102,7 +153,7 @@ class HandlerRegistry:
         """Decorator for SessionStart events."""
 
         def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
-            self._lifecycle_handlers["SessionStart"].append((func, when))
+            self._add_route(("SessionStart", ""), func, when)
             return func
 
         return decorator
@@ -113,7 +164,7 @@ class HandlerRegistry:
         """Decorator for SessionEnd events."""
 
         def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
-            self._lifecycle_handlers["SessionEnd"].append((func, when))
+            self._add_route(("SessionEnd", ""), func, when)
             return func
 
         return decorator
@@ -124,7 +175,7 @@ class HandlerRegistry:
         """Decorator for PreCompact events."""
 
         def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
-            self._lifecycle_handlers["PreCompact"].append((func, when))
+            self._add_route(("PreCompact", ""), func, when)
             return func
 
         return decorator
@@ -135,7 +186,7 @@ class HandlerRegistry:
         """Decorator for UserPromptSubmit events."""
 
         def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
-            self._lifecycle_handlers["UserPromptSubmit"].append((func, when))
+            self._add_route(("UserPromptSubmit", ""), func, when)
             return func
 
         return decorator
@@ -146,7 +197,7 @@ class HandlerRegistry:
         """Decorator for Notification events."""
 
         def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
-            self._lifecycle_handlers["Notification"].append((func, when))
+            self._add_route(("Notification", ""), func, when)
             return func
 
         return decorator
@@ -168,7 +219,7 @@ class HandlerRegistry:
         def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
             targets = tools if tools else ("*",)
             for tool in targets:
-                self._permission_handlers[tool].append((func, when))
+                self._add_route(("PermissionRequest", tool), func, when)
             return func
 
         return decorator
@@ -6,10 +6,27 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
+
+def _dumps(output: dict[str, Any]) -> str:
+    """Serialize response JSON, with orjson when available."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(output).decode()
+        except TypeError:  # e.g. integers beyond 64 bits; let json handle it
+            pass
+    return json.dumps(output)
+
 
 class BaseHookResponse(ABC):
     """Abstract base class for hook responses."""
 
+    __slots__ = ()
+
     @abstractmethod
     def to_json(self) -> str:
         """Serialize to Claude Code expected JSON format."""
@@ -24,7 +41,7 @@ class BaseHookResponse(ABC):
         return True
 
 
-@dataclass
+@dataclass(slots=True)
 class HookResponse(BaseHookResponse):
     """Response from a hook handler."""
 
@@ -52,7 +69,7 @@ class HookResponse(BaseHookResponse):
         if self.interrupt:
             output["continue"] = False
 
-        return json.dumps(output) if output else ""
+        return _dumps(output) if output else ""
 
     def should_return(self) -> bool:
         """Only return deny/block responses."""
@@ -104,7 +121,7 @@ def block(reason: str) -> HookResponse:
 # ═══════════════════════════════════════════════════════════════════════════
 
 
-@dataclass
+@dataclass(slots=True)
 class PermissionHookResponse(BaseHookResponse):
     """Response for PermissionRequest hooks."""
 
@@ -131,7 +148,7 @@ class PermissionHookResponse(BaseHookResponse):
                 "decision": decision,
             }
         }
-        return json.dumps(output)
+        return _dumps(output)
 
 
 def approve_permission(
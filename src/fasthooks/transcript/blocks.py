@@ -2,9 +2,10 @@
 from __future__ import annotations
 
 import warnings
+from collections.abc import Callable
 from typing import TYPE_CHECKING, Any, Literal
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 if TYPE_CHECKING:
     from fasthooks.transcript.core import Transcript
@@ -32,6 +33,14 @@ class ToolUseBlock(BaseModel):
     # Private - not serialized
     _transcript: Transcript | None = None
 
+    @field_validator("input", mode="plain")
+    @classmethod
+    def _check_input(cls, value: Any) -> dict[str, Any]:
+        """Accept any dict without validating the opaque tool payload."""
+        if not isinstance(value, dict):
+            raise ValueError("input must be a dict")
+        return dict(value)
+
     def set_transcript(self, transcript: Transcript) -> None:
         """Set transcript reference for relationship lookups."""
         object.__setattr__(self, "_transcript", transcript)
@@ -58,6 +67,16 @@ class ToolResultBlock(BaseModel):
     _transcript: Transcript | None = None
     _tool_use_result: dict[str, Any] | str | None = None
 
+    @field_validator("content", mode="plain")
+    @classmethod
+    def _check_content(cls, value: Any) -> str | list[dict[str, Any]]:
+        """Accept a string or list of dicts without validating each item."""
+        if isinstance(value, str):
+            return value
+        if not isinstance(value, list) or not all(isinstance(i, dict) for i in value):
+            raise ValueError("content must be a string or a list of dicts")
+        return list(value)
+
     def set_transcript(self, transcript: Transcript) -> None:
         """Set transcript reference for relationship lookups."""
         object.__setattr__(self, "_transcript", transcript)
@@ -99,6 +118,14 @@ class UnknownBlock(BaseModel):
 # Union type for all content blocks
 ContentBlock = TextBlock | ToolUseBlock | ToolResultBlock | ThinkingBlock | UnknownBlock
 
+# Validator per known block type; anything else is validated as UnknownBlock
+_BLOCK_VALIDATORS: dict[str, Callable[[Any], ContentBlock]] = {
+    "text": TextBlock.model_validate,
+    "tool_use": ToolUseBlock.model_validate,
+    "tool_result": ToolResultBlock.model_validate,
+    "thinking": ThinkingBlock.model_validate,
+}
+
 
 def parse_content_block(
     data: dict[str, Any],
@@ -115,24 +142,8 @@ def parse_content_block(
         validate: Validation mode - "strict" raises, "warn" logs warning, "none" silent
     """
     block_type = data.get("type", "")
-
-    if block_type == "text":
-        return TextBlock.model_validate(data)
-    elif block_type == "tool_use":
-        tool_use = ToolUseBlock.model_validate(data)
-        if transcript:
-            tool_use.set_transcript(transcript)
-        return tool_use
-    elif block_type == "tool_result":
-        tool_result = ToolResultBlock.model_validate(data)
-        if transcript:
-            tool_result.set_transcript(transcript)
-        if tool_use_result:
-            tool_result.set_tool_use_result(tool_use_result)
-        return tool_result
-    elif block_type == "thinking":
-        return ThinkingBlock.model_validate(data)
-    else:
+    validator = _BLOCK_VALIDATORS.get(block_type)
+    if validator is None:
         # Unknown block type - preserve original type for forward compatibility
         if validate == "strict":
             raise ValueError(f"Unknown content block type: {block_type!r}")
@@ -143,5 +154,11 @@ def parse_content_block(
                 UserWarning,
                 stacklevel=2,
             )
-        # Return UnknownBlock that preserves original type
-        return UnknownBlock.model_validate(data)
+        validator = UnknownBlock.model_validate
+
+    block = validator(data)
+    if transcript and isinstance(block, (ToolUseBlock, ToolResultBlock)):
+        block.set_transcript(transcript)
+    if tool_use_result and isinstance(block, ToolResultBlock):
+        block.set_tool_use_result(tool_use_result)
+    return block
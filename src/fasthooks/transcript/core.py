@@ -1,8 +1,9 @@
 """Core Transcript class for loading and querying transcript data."""
 from __future__ import annotations
 
+import itertools
 import json
-from collections.abc import Iterator
+from collections.abc import Callable, Iterable, Iterator
 from contextlib import contextmanager
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Generator, Literal
@@ -13,17 +14,82 @@ from fasthooks.transcript.entries import (
     CompactBoundary,
     Entry,
     FileHistorySnapshot,
+    StopHookSummary,
     SystemEntry,
     TranscriptEntry,
     UserMessage,
     parse_entry,
 )
 
+# orjson (the "fast" extra) decodes JSONL lines noticeably faster than json
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - optional speedup
+    from json import loads as _json_loads  # type: ignore[assignment]
+
 if TYPE_CHECKING:
     from fasthooks.transcript.query import TranscriptQuery
     from fasthooks.transcript.turn import Turn
 
 
+def _index_uuid(transcript: Transcript, entry: Entry) -> None:
+    """Index an entry by UUID."""
+    if entry.uuid:
+        transcript._uuid_index[entry.uuid] = entry
+
+
+def _index_assistant(transcript: Transcript, entry: AssistantMessage) -> None:
+    """Index an assistant message, its tool uses and its request_id."""
+    _index_uuid(transcript, entry)
+    for block in entry.content:
+        if isinstance(block, ToolUseBlock):
+            transcript._tool_use_index[block.id] = block
+            block.set_transcript(transcript)
+    # Index by request_id for turn grouping
+    if entry.request_id:
+        transcript._request_id_index.setdefault(entry.request_id, []).append(entry)
+
+
+def _index_user(transcript: Transcript, entry: UserMessage) -> None:
+    """Index a user message and its tool results."""
+    _index_uuid(transcript, entry)
+    for block in entry.tool_results:
+        transcript._tool_result_index[block.tool_use_id] = block
+        block.set_transcript(transcript)
+
+
+def _index_snapshot(transcript: Transcript, entry: FileHistorySnapshot) -> None:
+    """Index a file history snapshot by message_id."""
+    if entry.message_id:
+        transcript._snapshot_index[entry.message_id] = entry
+
+
+def _index_nothing(transcript: Transcript, entry: TranscriptEntry) -> None:
+    """Entries that carry nothing to index."""
+
+
+# Indexer per exact entry type, so indexing is one dict lookup per entry
+_INDEXERS: dict[type, Callable[[Transcript, Any], None]] = {
+    AssistantMessage: _index_assistant,
+    UserMessage: _index_user,
+    FileHistorySnapshot: _index_snapshot,
+    SystemEntry: _index_uuid,
+    CompactBoundary: _index_uuid,
+    StopHookSummary: _index_uuid,
+    Entry: _index_uuid,
+}
+
+
+def _find_indexer(entry_type: type) -> Callable[[Transcript, Any], None]:
+    """Resolve (and cache) the indexer for a type missing from _INDEXERS."""
+    indexer = next(
+        (_INDEXERS[cls] for cls in entry_type.__mro__ if cls in _INDEXERS),
+        _index_nothing,
+    )
+    _INDEXERS[entry_type] = indexer
+    return indexer
+
+
 class Transcript:
     """
     Mutable collection of entries backed by a JSONL file.
@@ -88,70 +154,43 @@ class Transcript:
             self._loaded = True
             return
 
-        # Find last compact boundary to split archived vs current
-        raw_entries: list[dict[str, Any]] = []
+        # Decode each raw JSONL line and validate it into its entry model
+        parsed: list[TranscriptEntry] = []
         last_compact_idx = -1
 
-        with open(self.path) as f:
+        with open(self.path, "rb") as f:
             for line_num, line in enumerate(f, 1):
-                line = line.strip()
-                if not line:
+                if not line.strip():
                     continue
                 try:
-                    data = json.loads(line)
-                    data["_line_number"] = line_num
-                    raw_entries.append(data)
-
-                    if data.get("subtype") == "compact_boundary":
-                        last_compact_idx = len(raw_entries) - 1
+                    data = _json_loads(line)
                 except json.JSONDecodeError:
                     if self.validate == "strict":
                         raise
                     continue
 
-        # Parse entries and split archived vs current
-        for i, data in enumerate(raw_entries):
-            entry = parse_entry(data, self)
+                entry = parse_entry(data, self)
 
-            # Set line number
-            if hasattr(entry, "_line_number"):
-                object.__setattr__(entry, "_line_number", data.get("_line_number"))
+                object.__setattr__(entry, "_line_number", line_num)
+                if isinstance(entry, CompactBoundary):
+                    last_compact_idx = len(parsed)
+                parsed.append(entry)
 
-            if i <= last_compact_idx:
-                self._archived.append(entry)
-            else:
-                self.entries.append(entry)
+        # Split archived vs current at the last compact boundary
+        self._archived = parsed[: last_compact_idx + 1]
+        self.entries = parsed[last_compact_idx + 1 :]
 
-            # Build indexes
+        # Build indexes
+        for entry in parsed:
             self._index_entry(entry)
 
         self._loaded = True
 
     def _index_entry(self, entry: TranscriptEntry) -> None:
         """Add entry to lookup indexes."""
-        # UUID index (only for Entry subclasses)
-        if isinstance(entry, Entry) and entry.uuid:
-            self._uuid_index[entry.uuid] = entry
-
-        # Tool use/result indexes + request_id index
-        if isinstance(entry, AssistantMessage):
-            for block in entry.content:
-                if isinstance(block, ToolUseBlock):
-                    self._tool_use_index[block.id] = block
-                    block.set_transcript(self)
-            # Index by request_id for turn grouping
-            if entry.request_id:
-                if entry.request_id not in self._request_id_index:
-                    self._request_id_index[entry.request_id] = []
-                self._request_id_index[entry.request_id].append(entry)
-        elif isinstance(entry, UserMessage) and entry.is_tool_result:
-            for block in entry.tool_results:
-                self._tool_result_index[block.tool_use_id] = block
-                block.set_transcript(self)
-        elif isinstance(entry, FileHistorySnapshot):
-            # Index snapshots by message_id
-            if entry.message_id:
-                self._snapshot_index[entry.message_id] = entry
+        entry_type = type(entry)
+        indexer = _INDEXERS.get(entry_type) or _find_indexer(entry_type)
+        indexer(self, entry)
 
     # === Relationship Lookups ===
 
@@ -200,9 +239,12 @@ class Transcript:
         if include_archived is None:
             include_archived = self.include_archived
 
-        source = self._archived + self.entries if include_archived else self.entries
+        # Scanned per call rather than indexed: parent_uuid is a plain
+        # field that callers may reassign at any time
         return [
-            e for e in source if isinstance(e, Entry) and e.parent_uuid == entry.uuid
+            e
+            for e in self._get_source(include_archived)
+            if isinstance(e, Entry) and e.parent_uuid == entry.uuid
         ]
 
     def get_entries_by_request_id(self, request_id: str) -> list[AssistantMessage]:
@@ -211,11 +253,19 @@ class Transcript:
 
     # === Pre-built Views ===
 
-    def _get_source(self, include_archived: bool | None = None) -> list[TranscriptEntry]:
-        """Get entry source based on include_archived setting."""
+    def _get_source(
+        self, include_archived: bool | None = None
+    ) -> Iterable[TranscriptEntry]:
+        """Get entry source based on include_archived setting.
+
+        Archived + current entries are chained rather than concatenated,
+        so callers wanting a list must build one themselves.
+        """
         if include_archived is None:
             include_archived = self.include_archived
-        return self._archived + self.entries if include_archived else self.entries
+        if include_archived:
+            return itertools.chain(self._archived, self.entries)
+        return self.entries
 
     def _filter_meta(self, entry: Entry) -> bool:
         """Check if entry should be included based on meta/visibility settings."""
@@ -255,6 +305,8 @@ class Transcript:
             include_meta = self.include_meta
         if not include_meta:
             entries = [e for e in entries if self._filter_meta(e)]
+        elif not isinstance(entries, list):
+            entries = list(entries)
 
         return TranscriptQuery(entries)
 
@@ -336,13 +388,17 @@ class Transcript:
     @property
     def errors(self) -> list[ToolResultBlock]:
         """Tool results where is_error=True."""
-        return [r for r in self.tool_results if r.is_error]
+        # Not memoized: is_error can be changed in place on a block
+        return [r for r in self._tool_result_index.values() if r.is_error]
 
     @property
     def compact_boundaries(self) -> list[CompactBoundary]:
         """All compaction markers (always includes archived)."""
-        all_entries = self._archived + self.entries
-        return [e for e in all_entries if isinstance(e, CompactBoundary)]
+        return [
+            e
+            for e in itertools.chain(self._archived, self.entries)
+            if isinstance(e, CompactBoundary)
+        ]
 
     def get_file_snapshots(
         self, include_archived: bool | None = None
@@ -371,13 +427,16 @@ class Transcript:
         """
         from fasthooks.transcript.turn import Turn
 
-        source = self._get_source(include_archived)
         # Use UUIDs for membership check (entries aren't hashable)
-        source_uuids = {e.uuid for e in source if isinstance(e, Entry) and e.uuid}
+        source_uuids = {
+            e.uuid
+            for e in self._get_source(include_archived)
+            if isinstance(e, Entry) and e.uuid
+        }
 
         result = []
         seen: set[str] = set()
-        for entry in source:
+        for entry in self._get_source(include_archived):
             if isinstance(entry, AssistantMessage) and entry.request_id:
                 if entry.request_id not in seen:
                     seen.add(entry.request_id)
@@ -753,9 +812,7 @@ class TranscriptStats:
         request_ids: set[str] = set()
 
         # Include both current and archived for full stats
-        all_entries = transcript._archived + transcript.entries
-
-        for entry in all_entries:
+        for entry in itertools.chain(transcript._archived, transcript.entries):
             # Track timestamps
             if hasattr(entry, "timestamp") and entry.timestamp:
                 if not first_ts:
@@ -2,11 +2,20 @@
 from __future__ import annotations
 
 import secrets
+import sys
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any, Literal
 from uuid import uuid4
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    ModelWrapValidatorHandler,
+    TypeAdapter,
+    ValidationInfo,
+    model_validator,
+)
 
 from fasthooks.transcript.blocks import (
     ContentBlock,
@@ -20,6 +29,28 @@ from fasthooks.transcript.blocks import (
 if TYPE_CHECKING:
     from fasthooks.transcript.core import Transcript
 
+# Tool results in a user message are validated as one list
+_TOOL_RESULTS_ADAPTER: TypeAdapter[list[ToolResultBlock]] = TypeAdapter(
+    list[ToolResultBlock]
+)
+
+# Entry fields whose values repeat verbatim across a transcript's entries
+_INTERNED_FIELDS = ("session_id", "cwd", "version", "git_branch", "user_type", "slug")
+
+
+def _intern_repeated_strings(entry: Entry) -> None:
+    """Intern repeated field values so entries share one copy of each."""
+    fields = entry.__dict__
+    for name in _INTERNED_FIELDS:
+        value = fields[name]
+        if type(value) is str:
+            fields[name] = sys.intern(value)
+
+
+def _intern(value: Any) -> Any:
+    """Intern a repeated value (model name, stop reason...) if it is a string."""
+    return sys.intern(value) if type(value) is str else value
+
 
 class Entry(BaseModel):
     """Base class for all transcript entries."""
@@ -52,10 +83,8 @@ class Entry(BaseModel):
         Uses camelCase aliases and excludes internal fields.
         mode='json' ensures datetime is serialized to ISO8601 string.
         """
-        data = self.model_dump(by_alias=True, exclude_none=True, mode="json")
-        # Remove internal fields
-        data.pop("_line_number", None)
-        return data
+        # Private attributes (_line_number, _content, ...) are never dumped
+        return self.model_dump(by_alias=True, exclude_none=True, mode="json")
 
 
 class UserMessage(Entry):
@@ -173,13 +202,10 @@ class UserMessage(Entry):
             message_content: str | list[dict[str, Any]] = self._content
         else:
             # Serialize tool result blocks
-            message_content = []
-            for block in self._content:
-                block_data = block.model_dump(by_alias=True, exclude_none=True)
-                # Remove private fields
-                block_data.pop("_transcript", None)
-                block_data.pop("_tool_use_result", None)
-                message_content.append(block_data)
+            message_content = [
+                block.model_dump(by_alias=True, exclude_none=True)
+                for block in self._content
+            ]
 
         # Get existing message dict or create new one
         message = data.get("message", {})
@@ -191,37 +217,54 @@ class UserMessage(Entry):
 
         return data
 
+    @model_validator(mode="wrap")
     @classmethod
-    def from_raw(
-        cls, data: dict[str, Any], transcript: Transcript | None = None
+    def _parse_message(
+        cls,
+        data: Any,
+        handler: ModelWrapValidatorHandler[UserMessage],
+        info: ValidationInfo,
     ) -> UserMessage:
-        """Parse from raw transcript dict, handling nested message.content."""
-        # Extract message content
-        message = data.get("message", {})
-        raw_content = message.get("content", "")
+        """Validate fields, then parse the nested message.content."""
+        instance = handler(data)
+        if not isinstance(data, dict) or "message" not in data:
+            return instance
+
+        transcript = _context_transcript(info)
+        raw_content = data["message"].get("content", "")
 
         # Parse content
         if isinstance(raw_content, str):
             content: str | list[ToolResultBlock] = raw_content
         elif isinstance(raw_content, list):
+            # Validate all tool results in one pydantic-core call
+            content = _TOOL_RESULTS_ADAPTER.validate_python(
+                [
+                    item
+                    for item in raw_content
+                    if isinstance(item, dict) and item.get("type") == "tool_result"
+                ]
+            )
             tool_use_result = data.get("toolUseResult")
-            content = []
-            for item in raw_content:
-                if isinstance(item, dict) and item.get("type") == "tool_result":
-                    block = ToolResultBlock.model_validate(item)
+            if transcript or tool_use_result:
+                for block in content:
                     if transcript:
                         block.set_transcript(transcript)
                     if tool_use_result:
                         block.set_tool_use_result(tool_use_result)
-                    content.append(block)
         else:
             content = ""
 
-        # Create instance with pydantic validation
-        instance = cls.model_validate(data)
         object.__setattr__(instance, "_content", content)
         return instance
 
+    @classmethod
+    def from_raw(
+        cls, data: dict[str, Any], transcript: Transcript | None = None
+    ) -> UserMessage:
+        """Parse from raw transcript dict, handling nested message.content."""
+        return cls.model_validate(data, context={"transcript": transcript})
+
 
 class AssistantMessage(Entry):
     """Claude's response."""
@@ -236,6 +279,14 @@ class AssistantMessage(Entry):
     _stop_reason: str | None = None
     _usage: dict[str, Any] = {}
 
+    def _set_content(self, content: list[ContentBlock]) -> None:
+        """Set content blocks, interning tool names."""
+        for block in content:
+            if isinstance(block, ToolUseBlock):
+                # Tool names repeat across a transcript; share one copy
+                block.__dict__["name"] = _intern(block.name)
+        object.__setattr__(self, "_content", content)
+
     @property
     def message_id(self) -> str:
         """Anthropic message ID."""
@@ -264,7 +315,12 @@ class AssistantMessage(Entry):
     @property
     def text(self) -> str:
         """Extract concatenated text from TextBlocks."""
-        return "\n".join(b.text for b in self._content if isinstance(b, TextBlock))
+        # Not cached: content may be edited in place. Most messages carry a
+        # single text block, which needs no join at all.
+        texts = [b.text for b in self._content if isinstance(b, TextBlock)]
+        if len(texts) == 1:
+            return texts[0]
+        return "\n".join(texts)
 
     @property
     def tool_uses(self) -> list[ToolUseBlock]:
@@ -274,9 +330,10 @@ class AssistantMessage(Entry):
     @property
     def thinking(self) -> str:
         """Extract thinking text."""
-        return "\n".join(
-            b.thinking for b in self._content if isinstance(b, ThinkingBlock)
-        )
+        texts = [b.thinking for b in self._content if isinstance(b, ThinkingBlock)]
+        if len(texts) == 1:
+            return texts[0]
+        return "\n".join(texts)
 
     @property
     def has_tool_use(self) -> bool:
@@ -352,7 +409,7 @@ class AssistantMessage(Entry):
         instance = cls.model_validate(data)
         object.__setattr__(instance, "_message_id", f"msg_{secrets.token_hex(12)}")
         object.__setattr__(instance, "_model", model)
-        object.__setattr__(instance, "_content", blocks)
+        instance._set_content(blocks)
         object.__setattr__(instance, "_stop_reason", stop_reason)
         object.__setattr__(instance, "_usage", {})
         return instance
@@ -362,13 +419,10 @@ class AssistantMessage(Entry):
         data = super().to_dict()
 
         # Serialize content blocks
-        content_list = []
-        for block in self._content:
-            block_data = block.model_dump(by_alias=True, exclude_none=True)
-            # Remove private fields
-            block_data.pop("_transcript", None)
-            block_data.pop("_tool_use_result", None)
-            content_list.append(block_data)
+        content_list = [
+            block.model_dump(by_alias=True, exclude_none=True)
+            for block in self._content
+        ]
 
         # Reconstruct message object
         message: dict[str, Any] = {
@@ -388,33 +442,51 @@ class AssistantMessage(Entry):
         data["message"] = message
         return data
 
+    @model_validator(mode="wrap")
     @classmethod
-    def from_raw(
-        cls, data: dict[str, Any], transcript: Transcript | None = None
+    def _parse_message(
+        cls,
+        data: Any,
+        handler: ModelWrapValidatorHandler[AssistantMessage],
+        info: ValidationInfo,
     ) -> AssistantMessage:
-        """Parse from raw transcript dict, handling nested message object."""
-        message = data.get("message", {})
+        """Validate fields, then parse the nested message object."""
+        instance = handler(data)
+        if not isinstance(data, dict) or "message" not in data:
+            return instance
+
+        transcript = _context_transcript(info)
+        message = data["message"]
         raw_content = message.get("content", [])
 
         # Get validate setting from transcript (default to "warn")
         validate = transcript.validate if transcript else "warn"
 
         # Parse content blocks
-        content = []
-        if isinstance(raw_content, list):
-            for item in raw_content:
-                if isinstance(item, dict):
-                    content.append(parse_content_block(item, transcript, validate=validate))
+        content = (
+            [
+                parse_content_block(item, transcript, validate=validate)
+                for item in raw_content
+                if isinstance(item, dict)
+            ]
+            if isinstance(raw_content, list)
+            else []
+        )
 
-        # Create instance with pydantic validation
-        instance = cls.model_validate(data)
         object.__setattr__(instance, "_message_id", message.get("id", ""))
-        object.__setattr__(instance, "_model", message.get("model", ""))
-        object.__setattr__(instance, "_content", content)
-        object.__setattr__(instance, "_stop_reason", message.get("stop_reason"))
+        object.__setattr__(instance, "_model", _intern(message.get("model", "")))
+        instance._set_content(content)
+        object.__setattr__(instance, "_stop_reason", _intern(message.get("stop_reason")))
         object.__setattr__(instance, "_usage", message.get("usage", {}))
         return instance
 
+    @classmethod
+    def from_raw(
+        cls, data: dict[str, Any], transcript: Transcript | None = None
+    ) -> AssistantMessage:
+        """Parse from raw transcript dict, handling nested message object."""
+        return cls.model_validate(data, context={"transcript": transcript})
+
 
 class SystemEntry(Entry):
     """System events and metadata."""
@@ -460,9 +532,7 @@ class FileHistorySnapshot(BaseModel):
 
     def to_dict(self) -> dict[str, Any]:
         """Serialize to dict for JSONL output."""
-        data = self.model_dump(by_alias=True, exclude_none=True, mode="json")
-        data.pop("_line_number", None)
-        return data
+        return self.model_dump(by_alias=True, exclude_none=True, mode="json")
 
 
 # Type alias for all entry types
@@ -477,26 +547,50 @@ TranscriptEntry = (
 )
 
 
+# Entry tags; unknown types/subtypes fall back to the base classes
+_ENTRY_TYPES = frozenset({"user", "assistant", "system", "file-history-snapshot"})
+_SYSTEM_SUBTYPES = frozenset({"compact_boundary", "stop_hook_summary"})
+
+
+def _entry_tag(data: dict[str, Any]) -> str:
+    """Pick the entry tag for a raw entry from its type (and system subtype)."""
+    entry_type = data.get("type", "")
+    subtype = data.get("subtype", "")
+
+    if entry_type == "system" and subtype in _SYSTEM_SUBTYPES:
+        return str(subtype)
+    if entry_type in _ENTRY_TYPES:
+        return str(entry_type)
+    return "entry"
+
+
+def _context_transcript(info: ValidationInfo) -> Transcript | None:
+    """Get the owning transcript passed via validation context, if any."""
+    if info.context:
+        transcript: Transcript | None = info.context.get("transcript")
+        return transcript
+    return None
+
+
+# Model per entry tag. A dict lookup plus model_validate is ~1.5x faster
+# than validating through a tagged-union TypeAdapter (or per-model adapters)
+_ENTRY_MODELS: dict[str, type[TranscriptEntry]] = {
+    "user": UserMessage,
+    "assistant": AssistantMessage,
+    "system": SystemEntry,
+    "compact_boundary": CompactBoundary,
+    "stop_hook_summary": StopHookSummary,
+    "file-history-snapshot": FileHistorySnapshot,
+    "entry": Entry,
+}
+
+
 def parse_entry(
     data: dict[str, Any], transcript: Transcript | None = None
 ) -> TranscriptEntry:
     """Parse an entry from raw dict based on type."""
-    entry_type = data.get("type", "")
-
-    if entry_type == "user":
-        return UserMessage.from_raw(data, transcript)
-    elif entry_type == "assistant":
-        return AssistantMessage.from_raw(data, transcript)
-    elif entry_type == "system":
-        subtype = data.get("subtype", "")
-        if subtype == "compact_boundary":
-            return CompactBoundary.model_validate(data)
-        elif subtype == "stop_hook_summary":
-            return StopHookSummary.model_validate(data)
-        else:
-            return SystemEntry.model_validate(data)
-    elif entry_type == "file-history-snapshot":
-        return FileHistorySnapshot.model_validate(data)
-    else:
-        # Unknown type - return base Entry
-        return Entry.model_validate(data)
+    model = _ENTRY_MODELS[_entry_tag(data)]
+    entry = model.model_validate(data, context={"transcript": transcript})
+    if isinstance(entry, Entry):
+        _intern_repeated_strings(entry)
+    return entry
@@ -6,6 +6,25 @@ from fasthooks import HookApp, allow, approve_permission, deny, deny_permission
 from fasthooks.responses import PermissionHookResponse
 from fasthooks.testing import MockEvent, TestClient
 
+# Fields shared by the raw PreToolUse payloads fed to app.run()
+_PRE_TOOL_EVENT = {
+    "session_id": "test",
+    "cwd": "/workspace",
+    "permission_mode": "default",
+    "hook_event_name": "PreToolUse",
+}
+
+
+def _pre_tool_stdin(
+    tool_name: str, tool_input: dict, tool_use_id: str = "t1"
+) -> StringIO:
+    """Build stdin for a raw PreToolUse event."""
+    return StringIO(json.dumps(_PRE_TOOL_EVENT | {
+        "tool_name": tool_name,
+        "tool_input": tool_input,
+        "tool_use_id": tool_use_id,
+    }))
+
 
 class TestHookAppBasic:
     def test_create_app(self):
@@ -16,21 +35,31 @@ class TestHookAppBasic:
     def test_run_no_handlers(self):
         """App with no handlers returns empty response."""
         app = HookApp()
-        stdin = StringIO(json.dumps({
-            "session_id": "test",
-            "cwd": "/workspace",
-            "permission_mode": "default",
-            "hook_event_name": "PreToolUse",
-            "tool_name": "Bash",
-            "tool_input": {"command": "ls"},
-            "tool_use_id": "t1",
-        }))
+        stdin = _pre_tool_stdin("Bash", {"command": "ls"})
         stdout = StringIO()
         app.run(stdin=stdin, stdout=stdout)
         # No handlers = allow by default (empty output)
         stdout.seek(0)
         assert stdout.read() == ""
 
+    def test_unrouted_event_not_parsed(self, monkeypatch):
+        """Events with no matching route skip event validation."""
+        import fasthooks.events.parse as parse_module
+
+        def fail_parse(data):
+            raise AssertionError("event should not be parsed")
+
+        monkeypatch.setattr(parse_module, "parse_event", fail_parse)
+        app = HookApp()
+
+        @app.pre_tool("Write")
+        def handler(event):
+            return deny("nope")
+
+        client = TestClient(app)
+        assert client.send(MockEvent.bash(command="ls")) is None
+        assert client.send(MockEvent.stop()) is None
+
 
 class TestHookAppHandlers:
     def test_pre_tool_handler(self):
@@ -44,30 +73,14 @@ class TestHookAppHandlers:
             return allow()
 
         # Test with safe command
-        stdin = StringIO(json.dumps({
-            "session_id": "test",
-            "cwd": "/workspace",
-            "permission_mode": "default",
-            "hook_event_name": "PreToolUse",
-            "tool_name": "Bash",
-            "tool_input": {"command": "ls"},
-            "tool_use_id": "t1",
-        }))
+        stdin = _pre_tool_stdin("Bash", {"command": "ls"})
         stdout = StringIO()
         app.run(stdin=stdin, stdout=stdout)
         stdout.seek(0)
         assert stdout.read() == ""  # allowed
 
         # Test with dangerous command
-        stdin2 = StringIO(json.dumps({
-            "session_id": "test",
-            "cwd": "/workspace",
-            "permission_mode": "default",
-            "hook_event_name": "PreToolUse",
-            "tool_name": "Bash",
-            "tool_input": {"command": "rm -rf /"},
-            "tool_use_id": "t2",
-        }))
+        stdin2 = _pre_tool_stdin("Bash", {"command": "rm -rf /"}, tool_use_id="t2")
         stdout2 = StringIO()
         app.run(stdin=stdin2, stdout=stdout2)
         stdout2.seek(0)
@@ -86,15 +99,7 @@ class TestHookAppHandlers:
             return allow()
 
         # Send Write event
-        stdin = StringIO(json.dumps({
-            "session_id": "test",
-            "cwd": "/workspace",
-            "permission_mode": "default",
-            "hook_event_name": "PreToolUse",
-            "tool_name": "Write",
-            "tool_input": {"file_path": "/test.txt"},
-            "tool_use_id": "t1",
-        }))
+        stdin = _pre_tool_stdin("Write", {"file_path": "/test.txt"})
         stdout = StringIO()
         app.run(stdin=stdin, stdout=stdout)
         assert calls == []  # Handler not called
@@ -110,20 +115,30 @@ class TestHookAppHandlers:
             return allow()
 
         for tool in ["Write", "Edit", "Bash"]:
-            stdin = StringIO(json.dumps({
-                "session_id": "test",
-                "cwd": "/workspace",
-                "permission_mode": "default",
-                "hook_event_name": "PreToolUse",
-                "tool_name": tool,
-                "tool_input": {},
-                "tool_use_id": "t1",
-            }))
+            stdin = _pre_tool_stdin(tool, {})
             stdout = StringIO()
             app.run(stdin=stdin, stdout=stdout)
 
         assert calls == ["Write", "Edit"]  # Bash not included
 
+    def test_unhashable_callable_handler(self):
+        """Callable instances that are not hashable can still deny."""
+        from dataclasses import dataclass
+
+        @dataclass
+        class Blocker:
+            reason: str
+
+            def __call__(self, event):
+                return deny(self.reason)
+
+        app = HookApp()
+        app.pre_tool("Bash")(Blocker("no"))
+
+        stdout = StringIO()
+        app.run(stdin=_pre_tool_stdin("Bash", {"command": "ls"}), stdout=stdout)
+        assert json.loads(stdout.getvalue())["decision"] == "deny"
+
 
 class TestAsyncHandlers:
     """Tests for async handler support."""
@@ -276,6 +291,48 @@ class TestCatchAllHandlers:
         assert response is not None
         assert response.decision == "deny"
 
+    def test_handler_registered_after_dispatch(self):
+        """Handlers added after a dispatch are picked up on the next one."""
+        from fasthooks import HookApp, allow
+
+        app = HookApp()
+        calls = []
+
+        @app.pre_tool("Bash")
+        def first(event):
+            calls.append("first")
+            return allow()
+
+        client = TestClient(app)
+        client.send(MockEvent.bash(command="ls"))
+
+        @app.pre_tool()
+        def catch_all(event):
+            calls.append("catch_all")
+            return allow()
+
+        client.send(MockEvent.bash(command="ls"))
+
+        assert calls == ["first", "first", "catch_all"]
+
+    def test_failing_handler_fails_open(self, capsys):
+        """A raising handler is reported by name and the chain continues."""
+        app = HookApp()
+
+        @app.pre_tool("Bash")
+        def broken(event):
+            raise RuntimeError("boom")
+
+        @app.pre_tool("Bash")
+        async def blocker(event):
+            return deny("blocked")
+
+        client = TestClient(app)
+        response = client.send(MockEvent.bash(command="ls"))
+
+        assert response.decision == "deny"
+        assert "Handler broken failed: boom" in capsys.readouterr().err
+
 
 class TestPermissionRequestHandlers:
     """Tests for PermissionRequest handlers."""
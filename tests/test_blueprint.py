@@ -20,7 +20,7 @@ class TestBlueprintBasic:
         def check_bash(event):
             return allow()
 
-        assert len(bp._pre_tool_handlers["Bash"]) == 1
+        assert len(bp._routes[("PreToolUse", "Bash")]) == 1
 
     def test_blueprint_on_stop(self):
         """Blueprint supports lifecycle decorators."""
@@ -30,7 +30,7 @@ class TestBlueprintBasic:
         def handle_stop(event):
             return allow()
 
-        assert len(bp._lifecycle_handlers["Stop"]) == 1
+        assert len(bp._routes[("Stop", "")]) == 1
 
 
 class TestBlueprintInclude:
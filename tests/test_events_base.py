@@ -49,3 +49,77 @@ class TestBaseEvent:
         event = BaseEvent.model_validate(data)
         assert event.session_id == "abc123"
         # Should not raise, extra fields ignored
+
+
+class TestParseEvent:
+    BASE = {
+        "session_id": "abc123",
+        "cwd": "/workspace",
+        "permission_mode": "default",
+    }
+
+    def test_tool_event_by_tool_name(self):
+        """Tool hooks parse into the tool-specific event class."""
+        from fasthooks.events import Bash, parse_event
+
+        event = parse_event({
+            **self.BASE,
+            "hook_event_name": "PreToolUse",
+            "tool_name": "Bash",
+            "tool_input": {"command": "ls"},
+            "tool_use_id": "t1",
+        })
+        assert isinstance(event, Bash)
+        assert event.command == "ls"
+
+    def test_unknown_tool_falls_back_to_tool_event(self):
+        """Unknown tools parse as generic ToolEvent."""
+        from fasthooks.events import ToolEvent, parse_event
+
+        event = parse_event({
+            **self.BASE,
+            "hook_event_name": "PermissionRequest",
+            "tool_name": "mcp__custom",
+            "tool_input": {},
+            "tool_use_id": "t1",
+        })
+        assert type(event) is ToolEvent
+
+    def test_lifecycle_event(self):
+        """Lifecycle hooks parse by hook_event_name."""
+        from fasthooks.events import Stop, parse_event
+
+        event = parse_event({**self.BASE, "hook_event_name": "Stop", "stop_hook_active": True})
+        assert isinstance(event, Stop)
+        assert event.stop_hook_active is True
+
+    def test_unknown_hook_falls_back_to_base_event(self):
+        """Unknown hook types parse as BaseEvent."""
+        from fasthooks.events import parse_event
+
+        event = parse_event({**self.BASE, "hook_event_name": "SomethingNew"})
+        assert type(event) is BaseEvent
+
+
+class TestLazyImports:
+    def test_import_does_not_load_event_models(self):
+        """Importing fasthooks defers tool/lifecycle event models."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, fasthooks, fasthooks.events; "
+            "print(sorted(m for m in sys.modules if m in "
+            "('fasthooks.events.tools', 'fasthooks.events.lifecycle')))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "[]"
+
+    def test_unknown_attribute(self):
+        """Unknown names still raise AttributeError."""
+        import fasthooks.events
+
+        with pytest.raises(AttributeError):
+            fasthooks.events.NotAnEvent
@@ -1,6 +1,6 @@
 """Tests for stdin/stdout IO handling."""
 import json
-from io import StringIO
+from io import BytesIO, StringIO, TextIOWrapper
 
 from fasthooks import HookResponse
 from fasthooks._internal.io import read_stdin, write_stdout
@@ -26,6 +26,13 @@ class TestReadStdin:
         data = read_stdin(stdin)
         assert data == {}
 
+    def test_read_binary_buffer(self):
+        """read_stdin reads raw bytes from the stream's buffer when present."""
+        raw = '{"session_id": "abc", "prompt": "caf\u00e9"}'.encode()
+        stdin = TextIOWrapper(BytesIO(raw), encoding="utf-8")
+        data = read_stdin(stdin)
+        assert data == {"session_id": "abc", "prompt": "caf\u00e9"}
+
 
 class TestWriteStdout:
     def test_write_response(self):
@@ -39,6 +46,14 @@ class TestWriteStdout:
         assert data["decision"] == "deny"
         assert data["reason"] == "test"
 
+    def test_write_non_ascii_to_binary_buffer(self):
+        """write_stdout emits UTF-8 bytes even if the text layer is ASCII."""
+        raw = BytesIO()
+        stdout = TextIOWrapper(raw, encoding="ascii")
+        write_stdout(HookResponse(decision="deny", reason="caf\u00e9"), stdout)
+        data = json.loads(raw.getvalue().decode("utf-8"))
+        assert data["reason"] == "caf\u00e9"
+
     def test_write_empty_response(self):
         """write_stdout writes nothing for empty response."""
         stdout = StringIO()
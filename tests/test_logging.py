@@ -0,0 +1,293 @@
+"""Tests for built-in JSONL event logging."""
+import json
+import os
+import re
+
+import pytest
+
+from fasthooks.logging import EventLogger
+
+
+class TestEventLogger:
+    def test_log_writes_session_file(self, tmp_path):
+        """log() appends one JSON line per event to the session file."""
+        logger = EventLogger(tmp_path)
+        data = {
+            "session_id": "s1",
+            "hook_event_name": "PreToolUse",
+            "tool_name": "Bash",
+            "tool_input": {"command": "ls"},
+        }
+        logger.log(data)
+        logger.log(data)
+
+        lines = (tmp_path / "hooks-s1.jsonl").read_text().splitlines()
+        assert len(lines) == 2
+        entry = json.loads(lines[0])
+        assert entry["event"] == "PreToolUse"
+        assert entry["bash_command"] == "ls"
+        assert re.fullmatch(r"\d{4}-\d\d-\d\dT\d\d:\d\d:\d\dZ", entry["ts"])
+
+    def test_unsafe_session_id(self, tmp_path):
+        """Session ids that are not plain names never become file paths."""
+        logger = EventLogger(tmp_path / "logs")
+        logger.log({"session_id": "../escape", "hook_event_name": "Stop"})
+        logger.log({"session_id": 42, "hook_event_name": "Stop"})
+
+        assert not (tmp_path / "escape.jsonl").exists()
+        lines = (tmp_path / "logs" / "hooks-unknown.jsonl").read_text().splitlines()
+        assert json.loads(lines[0])["session_id"] == "../escape"
+        assert len(lines) == 2
+
+    def test_log_round_trips_unusual_values(self, tmp_path):
+        """Non-ASCII text and integers beyond 64 bits survive a log line."""
+        logger = EventLogger(tmp_path)
+        logger.log({
+            "session_id": "s1",
+            "hook_event_name": "UserPromptSubmit",
+            "prompt": "héllo ✓",
+        })
+        logger.log({
+            "session_id": "s1",
+            "hook_event_name": "PostToolUse",
+            "tool_name": "Bash",
+            "tool_input": {"command": "echo"},
+            "tool_response": {"value": 2**70},
+        })
+
+        lines = (tmp_path / "hooks-s1.jsonl").read_text(encoding="utf-8").splitlines()
+        assert json.loads(lines[0])["prompt"] == "héllo ✓"
+        assert json.loads(lines[1])["tool_response"]["value"] == 2**70
+
+    def test_timestamp_reused_within_second(self, tmp_path, monkeypatch):
+        """The timestamp is formatted once per second and reused."""
+        logger = EventLogger(tmp_path)
+        monkeypatch.setattr("fasthooks.logging.time.time", lambda: 1704067200.25)
+        assert logger._now_iso() == "2024-01-01T00:00:00Z"
+
+        monkeypatch.setattr("fasthooks.logging.time.time", lambda: 1704067200.75)
+        assert logger._now_iso() == "2024-01-01T00:00:00Z"
+
+        monkeypatch.setattr("fasthooks.logging.time.time", lambda: 1704067201.0)
+        assert logger._now_iso() == "2024-01-01T00:00:01Z"
+
+    def test_buffered_writes(self, tmp_path):
+        """With buffer_size, lines are held until the buffer fills or flushes."""
+        logger = EventLogger(tmp_path, buffer_size=1024)
+        log_file = tmp_path / "hooks-s1.jsonl"
+
+        # The first event is written so latest.jsonl can point at it
+        logger.log({"session_id": "s1", "hook_event_name": "Stop"})
+        logger.log({"session_id": "s1", "hook_event_name": "Stop"})
+        assert len(log_file.read_text().splitlines()) == 1
+
+        logger.flush()
+        assert len(log_file.read_text().splitlines()) == 2
+
+        logger.log({"session_id": "s1", "hook_event_name": "Stop", "cwd": "x" * 2048})
+        assert len(log_file.read_text().splitlines()) == 3  # Over the limit
+        logger.close()
+
+    def test_buffered_session_written_before_latest(self, tmp_path):
+        """latest.jsonl only moves to a session once its lines are on disk."""
+        logger = EventLogger(tmp_path, buffer_size=1024)
+        logger.log({"session_id": "s1", "hook_event_name": "Stop"})
+
+        assert os.readlink(tmp_path / "latest.jsonl") == "hooks-s1.jsonl"
+        assert len((tmp_path / "latest.jsonl").read_text().splitlines()) == 1
+        logger.close()
+
+    def test_close_flushes(self, tmp_path):
+        """close() writes buffered lines and stops buffering."""
+        logger = EventLogger(tmp_path, buffer_size=1024)
+        logger.log({"session_id": "s1", "hook_event_name": "Stop"})
+        logger.close()
+        logger.log({"session_id": "s1", "hook_event_name": "Stop"})
+
+        assert len((tmp_path / "hooks-s1.jsonl").read_text().splitlines()) == 2
+
+    def test_buffered_logger_not_kept_alive(self, tmp_path):
+        """Buffering does not keep a dropped logger alive; it flushes on collection."""
+        import gc
+        import weakref
+
+        logger = EventLogger(tmp_path, buffer_size=1024)
+        logger.log({"session_id": "s1", "hook_event_name": "Stop"})
+        ref = weakref.ref(logger)
+        del logger
+        gc.collect()
+
+        assert ref() is None
+        assert len((tmp_path / "hooks-s1.jsonl").read_text().splitlines()) == 1
+
+    def test_concurrent_logging(self, tmp_path):
+        """Events logged from several threads all land as whole lines."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        logger = EventLogger(tmp_path, buffer_size=256, max_open_files=2)
+
+        def log_many(session_id):
+            for i in range(200):
+                logger.log({
+                    "session_id": session_id,
+                    "hook_event_name": "UserPromptSubmit",
+                    "prompt": str(i),
+                })
+
+        sessions = ["s1", "s2", "s3", "s4"]
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(log_many, sessions))
+        logger.close()
+
+        for session_id in sessions:
+            lines = (tmp_path / f"hooks-{session_id}.jsonl").read_text().splitlines()
+            assert [json.loads(line)["prompt"] for line in lines] == [
+                str(i) for i in range(200)
+            ]
+
+    def test_open_files_bounded(self, tmp_path):
+        """Session files stay open up to max_open_files, oldest closed first."""
+        logger = EventLogger(tmp_path, max_open_files=2)
+        for session_id in ("s1", "s2", "s3", "s1"):
+            logger.log({"session_id": session_id, "hook_event_name": "Stop"})
+        assert list(logger._fds) == ["s3", "s1"]
+
+        logger.close()
+        assert not logger._fds
+        assert len((tmp_path / "hooks-s1.jsonl").read_text().splitlines()) == 2
+
+    def test_no_open_files_kept(self, tmp_path):
+        """max_open_files=0 closes each session file right after writing."""
+        logger = EventLogger(tmp_path, max_open_files=0)
+        for session_id in ("s1", "s2", "s1"):
+            logger.log({"session_id": session_id, "hook_event_name": "Stop"})
+            assert not logger._fds
+
+        assert len((tmp_path / "hooks-s1.jsonl").read_text().splitlines()) == 2
+        assert len((tmp_path / "hooks-s2.jsonl").read_text().splitlines()) == 1
+
+    def test_no_open_files_durable(self, tmp_path, monkeypatch):
+        """With max_open_files=0, durable writes sync before the file closes."""
+        synced = []
+        monkeypatch.setattr("fasthooks.logging._fdatasync", synced.append)
+        logger = EventLogger(tmp_path, max_open_files=0)
+
+        logger.log({"session_id": "s1", "hook_event_name": "Stop"})
+        assert synced == []
+        logger.log({"session_id": "s1", "hook_event_name": "Stop"}, durable=True)
+        assert len(synced) == 1
+
+    def test_fsync_every(self, tmp_path, monkeypatch):
+        """Open session files are synced once every fsync_every events."""
+        synced = []
+        monkeypatch.setattr("fasthooks.logging._fdatasync", synced.append)
+        logger = EventLogger(tmp_path, fsync_every=2)
+
+        logger.log({"session_id": "s1", "hook_event_name": "Stop"})
+        assert synced == []
+        logger.log({"session_id": "s1", "hook_event_name": "Stop"})
+        assert synced == [logger._fds["s1"]]
+        logger.close()
+
+    def test_durable_log_syncs_buffer(self, tmp_path, monkeypatch):
+        """durable=True writes any buffered lines and syncs before returning."""
+        synced = []
+        monkeypatch.setattr("fasthooks.logging._fdatasync", synced.append)
+        logger = EventLogger(tmp_path, buffer_size=1024)
+
+        logger.log({"session_id": "s1", "hook_event_name": "Stop"})
+        logger.log({"session_id": "s1", "hook_event_name": "Stop"}, durable=True)
+        assert len((tmp_path / "hooks-s1.jsonl").read_text().splitlines()) == 2
+        assert synced == [logger._fds["s1"]]
+        logger.close()
+
+    def test_latest_symlink(self, tmp_path):
+        """latest.jsonl points at the most recent session file."""
+        logger = EventLogger(tmp_path)
+        logger.log({"session_id": "s1", "hook_event_name": "Stop"})
+        logger.log({"session_id": "s2", "hook_event_name": "Stop"})
+
+        latest = tmp_path / "latest.jsonl"
+        assert latest.is_symlink()
+        assert latest.resolve() == (tmp_path / "hooks-s2.jsonl").resolve()
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "hooks-s1.jsonl",
+            "hooks-s2.jsonl",
+            "latest.jsonl",
+        ]
+
+    def test_latest_same_session_not_relinked(self, tmp_path, monkeypatch):
+        """Repeated events for one session do not recreate latest.jsonl."""
+        logger = EventLogger(tmp_path)
+        logger.log({"session_id": "s1", "hook_event_name": "Stop"})
+
+        def fail_symlink(src, dst):
+            raise AssertionError("latest.jsonl should not be recreated")
+
+        monkeypatch.setattr(os, "symlink", fail_symlink)
+        logger.log({"session_id": "s1", "hook_event_name": "Stop"})
+
+    def test_latest_repointed_by_other_writer(self, tmp_path):
+        """A link moved by another process is pointed back on the next event."""
+        logger = EventLogger(tmp_path)
+        logger.log({"session_id": "s1", "hook_event_name": "Stop"})
+
+        # Another process logging to the same directory moves the link
+        other = EventLogger(tmp_path)
+        other.log({"session_id": "s2", "hook_event_name": "Stop"})
+
+        logger.log({"session_id": "s1", "hook_event_name": "Stop"})
+        assert os.readlink(tmp_path / "latest.jsonl") == "hooks-s1.jsonl"
+
+    def test_latest_replaces_regular_file(self, tmp_path):
+        """A stray regular latest.jsonl is replaced by the symlink."""
+        (tmp_path / "latest.jsonl").write_text("stale")
+        logger = EventLogger(tmp_path)
+        logger.log({"session_id": "s1", "hook_event_name": "Stop"})
+
+        assert os.readlink(tmp_path / "latest.jsonl") == "hooks-s1.jsonl"
+
+
+@pytest.fixture(scope="module")
+def logger(tmp_path_factory):
+    """Shared logger for _build_entry tests, which never write files."""
+    return EventLogger(tmp_path_factory.mktemp("logs"))
+
+
+class TestBuildEntry:
+    def test_none_fields_dropped(self, logger):
+        """Fields missing from the input are omitted, not written as null."""
+        entry = logger._build_entry(
+            {"session_id": "s1", "hook_event_name": "Stop"}, "ts"
+        )
+        assert entry == {"ts": "ts", "session_id": "s1", "event": "Stop"}
+
+    def test_lifecycle_fields(self, logger):
+        """Lifecycle events flatten their specific fields."""
+        entry = logger._build_entry(
+            {
+                "session_id": "s1",
+                "hook_event_name": "Notification",
+                "message": "hi",
+                "notification_type": "idle",
+            },
+            "ts",
+        )
+        assert entry["message"] == "hi"
+        assert entry["notification_type"] == "idle"
+
+    def test_task_response_agent_id(self, logger):
+        """PostToolUse on Task extracts agent_id from the tool response."""
+        entry = logger._build_entry(
+            {
+                "session_id": "s1",
+                "hook_event_name": "PostToolUse",
+                "tool_name": "Task",
+                "tool_input": {"subagent_type": "explore", "model": "haiku"},
+                "tool_response": {"agentId": "ag1"},
+            },
+            "ts",
+        )
+        assert entry["subagent_type"] == "explore"
+        assert entry["subagent_model"] == "haiku"
+        assert entry["agent_id"] == "ag1"
@@ -34,6 +34,12 @@ class TestAllow:
         data = json.loads(response.to_json())
         assert data["hookSpecificOutput"]["updatedInput"] == {"command": "ls -la"}
 
+    def test_allow_to_json_with_large_int(self):
+        """Integers beyond 64 bits in updated input still serialize."""
+        response = allow(modify={"count": 2**70})
+        data = json.loads(response.to_json())
+        assert data["hookSpecificOutput"]["updatedInput"] == {"count": 2**70}
+
 
 class TestDeny:
     def test_deny_basic(self):
@@ -331,3 +331,17 @@ class TestDIIntegration:
 
         # They should be the same class
         assert DepStats is CoreStats
+
+    def test_import_does_not_load_transcript(self):
+        """Importing fasthooks defers the transcript models until requested."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, fasthooks, fasthooks.depends; "
+            "print('fasthooks.transcript' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "False"
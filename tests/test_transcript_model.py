@@ -133,12 +133,35 @@ class TestContentBlocks:
 
         assert isinstance(block, UnknownBlock)
 
+    def test_content_block_union_isinstance(self):
+        """ContentBlock is a plain union usable with isinstance."""
+        from fasthooks.transcript import ContentBlock
+
+        block = parse_content_block({"type": "text", "text": "hi"})
+        assert isinstance(block, ContentBlock)
+
     def test_extra_fields_preserved(self):
         """Extra fields should be preserved via model_extra."""
         data = {"type": "text", "text": "Hello", "custom_field": "preserved"}
         block = parse_content_block(data)
         assert block.model_extra.get("custom_field") == "preserved"
 
+    def test_tool_payload_types_checked(self):
+        """Tool input and result content reject the wrong container type."""
+        from pydantic import ValidationError
+
+        with pytest.raises(ValidationError):
+            parse_content_block({"type": "tool_use", "input": None})
+        with pytest.raises(ValidationError):
+            parse_content_block({"type": "tool_result", "content": 3})
+
+    def test_tool_input_not_aliased(self):
+        """A parsed block does not share the caller's input dict."""
+        data = {"type": "tool_use", "id": "t1", "name": "Bash", "input": {"a": 1}}
+        block = parse_content_block(data)
+        data["input"]["a"] = 2
+        assert block.input == {"a": 1}
+
 
 class TestEntries:
     """Test entry parsing."""
@@ -226,6 +249,61 @@ class TestEntries:
         assert entry.thinking == "Let me think..."
         assert entry.text == "I'll help you"
 
+    def test_repeated_fields_interned(self):
+        """Entries parsed separately share one copy of repeated strings."""
+        # Equal strings built at runtime are distinct objects
+        cwd_a = "".join(["/workspace/", "project"])
+        cwd_b = "".join(["/work", "space/project"])
+        assert cwd_a is not cwd_b
+
+        first = parse_entry({"type": "user", "cwd": cwd_a, "message": {"content": "a"}})
+        second = parse_entry({"type": "assistant", "cwd": cwd_b, "message": {"content": []}})
+        assert first.cwd is second.cwd
+
+        # System entries and unknown entry types go through parse_entry too
+        system = parse_entry({"type": "system", "subtype": "compact_boundary",
+                              "cwd": "".join(["/workspace", "/project"])})
+        other = parse_entry({"type": "future", "cwd": "".join(["/", "workspace/project"])})
+        assert system.cwd is first.cwd
+        assert other.cwd is first.cwd
+
+    def test_message_strings_interned(self):
+        """Model names and tool names are shared across assistant messages."""
+
+        def make(model_parts, name_parts):
+            return parse_entry({
+                "type": "assistant",
+                "message": {
+                    "model": "".join(model_parts),
+                    "content": [{"type": "tool_use", "id": "t", "name": "".join(name_parts)}],
+                },
+            })
+
+        first = make(["claude-", "x"], ["Ba", "sh"])
+        second = make(["claude", "-x"], ["B", "ash"])
+        assert first.model is second.model
+        assert first.tool_uses[0].name is second.tool_uses[0].name
+
+    def test_assistant_text_reflects_block_edits(self):
+        """text/thinking are derived live, so in-place block edits show up."""
+        data = {
+            "type": "assistant",
+            "uuid": "asst-123",
+            "message": {
+                "content": [
+                    {"type": "text", "text": "one"},
+                    {"type": "tool_use", "id": "t1", "name": "Bash", "input": {}},
+                    {"type": "text", "text": "two"},
+                ],
+            },
+        }
+        entry = parse_entry(data)
+        assert entry.text == "one\ntwo"
+        assert entry.thinking == ""
+
+        entry.content[0].text = "ONE"
+        assert entry.text == "ONE\ntwo"
+
     def test_system_entry(self):
         data = {
             "type": "system",
@@ -419,6 +497,24 @@ class TestTranscriptEmpty:
         t.load()
         assert len(t.entries) == 0
 
+    def test_malformed_line_skipped(self, tmp_path):
+        """Lines that are not valid JSON are skipped, keeping line numbers."""
+        path = tmp_path / "malformed.jsonl"
+        path.write_text(
+            '{"type": "user", "uuid": "u1"}\nnot json\n\n{"type": "system", "uuid": "s1"}\n'
+        )
+        t = Transcript(path)
+        assert [e.uuid for e in t.entries] == ["u1", "s1"]
+        assert t.entries[1]._line_number == 4
+
+    def test_malformed_line_strict_raises(self, tmp_path):
+        """validate='strict' raises on a line that is not valid JSON."""
+        path = tmp_path / "malformed.jsonl"
+        path.write_text('{"type": "user", "uuid": "u1"}\nnot json\n')
+        t = Transcript(path, validate="strict", auto_load=False)
+        with pytest.raises(ValueError):
+            t.load()
+
 
 class TestTranscriptViews:
     """Test pre-built views."""
@@ -501,6 +597,68 @@ class TestTranscriptViews:
         assert len(t.errors) == 1
         assert t.errors[0].tool_use_id == "t2"
 
+    def test_views_track_mutation(self, transcript_with_entries):
+        """Derived views reflect CRUD calls and direct edits to entries."""
+        t = transcript_with_entries
+        assert t.compact_boundaries == []
+
+        # Removing the erroring result drops it from the tool views
+        t.remove(t.find_by_uuid("u3"))
+        assert t.errors == []
+        assert len(t.tool_results) == 1
+
+        # Edits that bypass the CRUD methods are seen as well
+        t.entries.append(CompactBoundary(uuid="c1"))
+        assert [e.uuid for e in t.compact_boundaries] == ["c1"]
+        t.entries.remove(t.find_by_uuid("a2"))
+        assert [e.uuid for e in t.assistant_messages] == ["a1"]
+
+        t.load()
+        assert len(t.errors) == 1
+        assert t.compact_boundaries == []
+
+    def test_views_are_copies(self, transcript_with_entries):
+        """Mutating a returned view does not affect later calls."""
+        t = transcript_with_entries
+        count = len(t.tool_uses)
+        t.tool_uses.clear()
+        t.turns.clear()
+        assert len(t.tool_uses) == count
+        assert t.turns == t.get_turns()
+
+    def test_errors_reflect_in_place_edits(self, transcript_with_entries):
+        """errors follows is_error changes made directly on a block."""
+        t = transcript_with_entries
+        t.errors[0].is_error = False
+        assert t.errors == []
+
+    def test_message_views_are_copies(self, transcript_with_entries):
+        """Clearing a returned message view does not affect later calls."""
+        t = transcript_with_entries
+        for view in ("user_messages", "assistant_messages", "system_entries",
+                     "file_snapshots"):
+            expected = getattr(t, view)
+            getattr(t, view).clear()
+            assert getattr(t, view) == expected
+
+    def test_message_views_track_settings_and_edits(self, transcript_with_entries):
+        """user_messages follows include_meta, in-place edits and direct appends."""
+        t = transcript_with_entries
+        count = len(t.user_messages)
+
+        # Marking an entry meta in place hides it unless include_meta is set
+        t.user_messages[0].is_meta = True
+        assert len(t.user_messages) == count - 1
+        t.include_meta = True
+        assert len(t.user_messages) == count
+        t.include_meta = False
+        assert len(t.user_messages) == count - 1
+
+        # Entries appended straight to the public list show up too
+        t.entries.append(UserMessage.create("hi"))
+        assert len(t.user_messages) == count
+        assert t.user_messages == t.get_user_messages()
+
 
 class TestNewFeatures:
     """Test new features: turns, include_archived, logical_parent, etc."""
@@ -755,6 +913,24 @@ class TestCRUDOperations:
         u2 = t.find_by_uuid("u2")
         assert u2.parent_uuid == "u1"  # Relinked to a1's parent
 
+    def test_get_children_after_relink(self, transcript_with_chain):
+        """get_children reflects relinking done by CRUD operations."""
+        t = transcript_with_chain
+        u1 = t.find_by_uuid("u1")
+        assert [e.uuid for e in t.get_children(u1)] == ["a1"]
+
+        t.remove(t.find_by_uuid("a1"), relink=True)
+        assert [e.uuid for e in t.get_children(u1)] == ["u2"]
+
+    def test_get_children_after_parent_assignment(self, transcript_with_chain):
+        """get_children sees parent_uuid assigned directly on an entry."""
+        t = transcript_with_chain
+        u1 = t.find_by_uuid("u1")
+        assert [e.uuid for e in t.get_children(u1)] == ["a1"]
+
+        t.find_by_uuid("u2").parent_uuid = "u1"
+        assert [e.uuid for e in t.get_children(u1)] == ["a1", "u2"]
+
     def test_remove_without_relink(self, transcript_with_chain):
         """Remove without relink leaves orphans."""
         t = transcript_with_chain
@@ -1484,6 +1660,16 @@ class TestFactories:
         assert msg.has_tool_use is True
         assert msg.tool_uses[0].name == "Bash"
 
+    def test_assistant_message_content_edited_in_place(self):
+        """Block views follow edits made through the content list."""
+        msg = AssistantMessage.create("before")
+        msg.content.append(ToolUseBlock(id="toolu_1", name="Bash", input={}))
+        assert msg.has_tool_use is True
+        assert [b.id for b in msg.tool_uses] == ["toolu_1"]
+
+        msg.content[0] = TextBlock(text="after")
+        assert msg.text == "after"
+
     def test_assistant_message_create_with_parent(self):
         """AssistantMessage.create() should set parent_uuid from parent."""
         parent = UserMessage.create("Question")